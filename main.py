@@ -1,6 +1,7 @@
 # import datascience
 
 # main.py
+from concurrent.futures import ThreadPoolExecutor
 from datascience import logger
 from datascience.pipeline.data_ingestion_pipeline import DataIngestionTrainingPipeline
 from datascience.pipeline.data_validation_pipeline import DataValidationTrainingPipeline
@@ -10,27 +11,50 @@ STAGE_NAME = "Data Ingestion stage"
 VALIDATION_STAGE_NAME = "Data Validation stage"
 TRANSFORMATION_STAGE_NAME = "Data Transformation stage"
 
+
+def run_stage(stage_name, run, *upstream):
+    """Run a pipeline stage once all of its upstream stages have finished"""
+    for future in upstream:
+        future.result()
+    logger.info(f">>>>>> stage {stage_name} started <<<<<<")
+    run()
+    logger.info(f">>>>>> stage {stage_name} completed <<<<<<\n\nx==========x")
+
+
+def run_ingestion():
+    data_ingestion = DataIngestionTrainingPipeline()
+    data_ingestion.initiate_data_ingestion()
+
+
+def run_validation():
+    data_validation = DataValidationTrainingPipeline()
+    data_validation.initiate_data_validation()
+
+
+def run_transformation():
+    data_transformation = DataTransformationTrainingPipeline()
+    data_transformation.initiate_data_transformation()
+
+
 if __name__ == '__main__':
     try:
         # General Message
         logger.info(f">>>>>> Running the pipeline <<<<<<\n\n")
-        # Data Ingestion Stage
-        logger.info(f">>>>>> stage {STAGE_NAME} started <<<<<<")
-        data_ingestion = DataIngestionTrainingPipeline()
-        data_ingestion.initiate_data_ingestion()
-        logger.info(f">>>>>> stage {STAGE_NAME} completed <<<<<<\n\nx==========x")
-        
-        # Data Validation Stage
-        logger.info(f">>>>>> stage {VALIDATION_STAGE_NAME} started <<<<<<")
-        data_validation = DataValidationTrainingPipeline()
-        data_validation.initiate_data_validation()
-        logger.info(f">>>>>> stage {VALIDATION_STAGE_NAME} completed <<<<<<\n\nx==========x")
-        
-        # Data Transformation Stage
-        logger.info(f">>>>>> stage {TRANSFORMATION_STAGE_NAME} started <<<<<<")
-        data_transformation = DataTransformationTrainingPipeline()
-        data_transformation.initiate_data_transformation()
-        logger.info(f">>>>>> stage {TRANSFORMATION_STAGE_NAME} completed <<<<<<\n\nx==========x")
+
+        # Validation and transformation both only need the ingested files,
+        # so they run concurrently once ingestion has finished
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            # Data Ingestion Stage
+            ingestion = executor.submit(run_stage, STAGE_NAME, run_ingestion)
+
+            # Data Validation Stage
+            validation = executor.submit(run_stage, VALIDATION_STAGE_NAME, run_validation, ingestion)
+
+            # Data Transformation Stage
+            transformation = executor.submit(run_stage, TRANSFORMATION_STAGE_NAME, run_transformation, ingestion)
+
+            for future in (ingestion, validation, transformation):
+                future.result()
         
     except Exception as e:
         logger.exception(e)
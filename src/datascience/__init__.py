@@ -1,5 +1,7 @@
 # src/datascience/__init__.py
+import atexit
 import logging
+import logging.handlers
 import os
 from datetime import datetime
 
@@ -7,12 +9,26 @@ LOGS_DIR = "logs"
 os.makedirs(LOGS_DIR, exist_ok=True)
 
 LOG_FILE = os.path.join(LOGS_DIR, f"{datetime.now().strftime('%Y-%m-%d')}.log")
+LOG_HANDLER_NAME = "mlops-buffered-file"
 
-logging.basicConfig(
-    filename=LOG_FILE,
-    level=logging.INFO,
-    format="[%(asctime)s: %(levelname)s: %(module)s: %(message)s]",
-    filemode="a"
-)
+root_logger = logging.getLogger()
+root_logger.setLevel(logging.INFO)
+
+# Open the log file once and batch records in memory; the buffer is flushed
+# when it fills up, on any ERROR record, and at interpreter shutdown
+if not any(handler.get_name() == LOG_HANDLER_NAME for handler in root_logger.handlers):
+    file_handler = logging.FileHandler(LOG_FILE, mode="a")
+    file_handler.setFormatter(
+        logging.Formatter("[%(asctime)s: %(levelname)s: %(module)s: %(message)s]")
+    )
+    memory_handler = logging.handlers.MemoryHandler(
+        capacity=1024,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+        flushOnClose=True,
+    )
+    memory_handler.set_name(LOG_HANDLER_NAME)
+    root_logger.addHandler(memory_handler)
+    atexit.register(memory_handler.flush)
 
 logger = logging.getLogger("mlops")
@@ -1,21 +1,76 @@
 import pandas as pd
 import json
 import os
+import shutil
 from datascience import logger
 from datascience.entity.config_entity import DataIngestionConfig
 
+INGESTED_MARKER = ".ingested"
+DATASET_FILE = "mental_health_and_technology_usage_2024.csv"
+
+
+def _link_or_copy(src: str, dst: str):
+    """Hard-link src to dst, copying instead across filesystems or where links are unsupported"""
+    if os.path.lexists(dst):
+        os.remove(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
 
 class DataIngestion:
     def __init__(self, config: DataIngestionConfig):
         self.config = config
 
+    def _marker_path(self) -> str:
+        return os.path.join(self.config.local_data_path, INGESTED_MARKER)
+
+    def is_dataset_cached(self) -> bool:
+        """True if a previous run ingested this dataset and all of its files, including the CSV, are still present"""
+        try:
+            with open(self._marker_path()) as f:
+                marker = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return False
+
+        files = marker.get("files", [])
+        return (
+            marker.get("dataset_id") == self.config.dataset_id
+            and DATASET_FILE in files
+            and all(os.path.exists(os.path.join(self.config.local_data_path, name)) for name in files)
+        )
+
     def download_dataset(self):
+        if self.is_dataset_cached():
+            logger.info(f"Dataset cache hit in {self.config.local_data_path}, skipping download")
+            return
+
         import kagglehub
         path = kagglehub.dataset_download(self.config.dataset_id)
         logger.info(f"Downloaded to: {path}")
 
         os.makedirs(self.config.local_data_path, exist_ok=True)
-        os.system(f"cp -r {path}/* {self.config.local_data_path}")
+
+        # Link rather than move, so kagglehub's cached copy of this version stays intact
+        files = []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                files.append(entry.name)
+                target = os.path.join(self.config.local_data_path, entry.name)
+                if entry.is_dir():
+                    shutil.copytree(entry.path, target, copy_function=_link_or_copy, dirs_exist_ok=True)
+                else:
+                    _link_or_copy(entry.path, target)
+        logger.info(f"Linked dataset files into: {self.config.local_data_path}")
+
+        if DATASET_FILE not in files:
+            logger.error(f"{DATASET_FILE} not found in {path}, not marking the dataset as ingested")
+            return
+
+        # Record a successful ingestion so later runs can skip the download
+        with open(self._marker_path(), "w") as f:
+            json.dump({"dataset_id": self.config.dataset_id, "files": files}, f)
 
     def convert_to_json(self, csv_filename: str, json_filename: str):
         """
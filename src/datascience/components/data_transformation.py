@@ -1,11 +1,49 @@
+import logging
 import pandas as pd
 import numpy as np
 import os
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+from contextlib import ExitStack
 from pathlib import Path
-from sklearn.preprocessing import LabelEncoder
+from joblib import Parallel, delayed
+from pandas._libs.parsers import STR_NA_VALUES
 from datascience import logger
 from datascience.entity.config_entity import DataTransformationConfig
 
+# Weights for the factors of the custom mood score (can be adjusted based on domain knowledge)
+MOOD_SCORE_WEIGHTS = {
+    'Sleep_Quality': 0.15,
+    'Exercise_Frequency': 0.10,
+    'Diet_Quality': 0.10,
+    'Work_Life_Balance': 0.15,
+    'Financial_Stress': -0.15,  # Negative weight as higher stress = lower mood
+    'Life_Satisfaction': 0.20,
+    'Future_Outlook': 0.15
+}
+MOOD_SCORE_COLUMNS = {factor: f"{factor}_encoded" for factor in MOOD_SCORE_WEIGHTS}
+
+
+def _code_dtype(n_categories: int) -> np.dtype:
+    """Smallest signed integer dtype that holds codes 0..n_categories-1 (and -1)"""
+    if n_categories <= np.iinfo(np.int8).max:
+        return np.dtype(np.int8)
+    if n_categories <= np.iinfo(np.int16).max:
+        return np.dtype(np.int16)
+    return np.dtype(np.int32)
+
+
+def _encode_column(series: pd.Series):
+    """Encode one column, returning its narrowest integer codes and sorted categories"""
+    # Hash-based categorical encoding (sorted categories, same codes as LabelEncoder).
+    # Columns read as 'category' already carry codes; only their order may need fixing.
+    cat = series.astype('category')
+    if not cat.cat.categories.is_monotonic_increasing:
+        cat = cat.cat.reorder_categories(cat.cat.categories.sort_values())
+    categories = cat.cat.categories
+    return cat.cat.codes.to_numpy(dtype=_code_dtype(len(categories))), categories
+
 
 class DataTransformation:
     def __init__(self, config: DataTransformationConfig):
@@ -35,124 +73,152 @@ class DataTransformation:
         if not data_file.exists():
             raise FileNotFoundError(f"Data file not found: {data_file}")
         
-        df = pd.read_csv(data_file)
+        dtypes = self.config.dtypes or {}
+        # Declared column types skip Arrow's type inference for those columns
+        column_types = {
+            column: pa.dictionary(pa.int32(), pa.string()) if dtype == 'category'
+            else pa.from_numpy_dtype(np.dtype(dtype))
+            for column, dtype in dtypes.items()
+        }
+        # Arrow parses blocks of the file in parallel across cores
+        table = pacsv.read_csv(
+            data_file,
+            read_options=pacsv.ReadOptions(use_threads=True, block_size=1 << 23),
+            convert_options=pacsv.ConvertOptions(
+                # pandas' NA strings, so e.g. "None" is missing here as in the chunked path
+                null_values=sorted(STR_NA_VALUES),
+                strings_can_be_null=True,
+                column_types=column_types,
+                include_columns=self.config.usecols,
+            ),
+        )
+        df = table.to_pandas(self_destruct=True)
+        del table
         logger.info(f"Loaded data with shape: {df.shape}")
         return df
 
-    def encode_all_string_columns(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Encode all string/categorical columns in the dataset"""
-        logger.info("Starting encoding of all string columns...")
-        
-        # Get all columns that are object (string) type
-        string_columns = df.select_dtypes(include=['object']).columns.tolist()
-        logger.info(f"Found {len(string_columns)} string columns to encode: {string_columns}")
-        
+    def _fill_missing_strings(self, df: pd.DataFrame, string_columns: list):
+        """Fill missing values in the string columns with 'Unknown' (in place)"""
+        # Handle missing values by filling with 'Unknown' in one bulk call
+        object_columns = [column for column in string_columns if df[column].dtype == object]
+        if object_columns:
+            df[object_columns] = df[object_columns].fillna('Unknown')
+
+        # Categorical columns need 'Unknown' as a category before it can be filled in
         for column in string_columns:
-            if column in df.columns:
-                # Initialize label encoder for this column
-                le = LabelEncoder()
-                
-                # Handle missing values by filling with 'Unknown'
+            if isinstance(df[column].dtype, pd.CategoricalDtype) and df[column].hasnans:
+                if 'Unknown' not in df[column].cat.categories:
+                    df[column] = df[column].cat.add_categories('Unknown')
                 df[column] = df[column].fillna('Unknown')
-                
-                # Fit and transform the column
-                df[f"{column}_encoded"] = le.fit_transform(df[column])
-                
-                # Store the label encoder for later use
-                self.label_encoders[column] = le
-                
-                logger.info(f"Encoded column: {column} -> {column}_encoded")
-            else:
-                logger.warning(f"Column {column} not found in dataset")
-        
-        return df
 
-    def cap_physical_activity(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Cap physical activity to maximum of 6"""
-        logger.info("Capping physical activity to maximum of 6...")
+    def fit_encoders(self, df: pd.DataFrame) -> dict:
+        """Fit an encoding for every string/categorical column and return their codes"""
+        # Get all columns that are object (string) or already categorical
+        string_columns = df.select_dtypes(include=['object', 'category']).columns.tolist()
+        logger.info(f"Found {len(string_columns)} string columns to encode: {string_columns}")
         
-        if 'Physical_Activity_Hours' in df.columns:
-            original_max = df['Physical_Activity_Hours'].max()
-            df['Physical_Activity_Hours'] = df['Physical_Activity_Hours'].clip(upper=6)
-            new_max = df['Physical_Activity_Hours'].max()
-            logger.info(f"Capped Physical_Activity_Hours from {original_max} to {new_max}")
+        if not string_columns:
+            return {}
+
+        self._fill_missing_strings(df, string_columns)
+
+        # Columns are independent, so encode them on a thread pool; pandas builds
+        # the category hash tables in C, largely outside the GIL
+        results = Parallel(n_jobs=-1, prefer="threads")(
+            delayed(_encode_column)(df[column]) for column in string_columns
+        )
+
+        codes = {}
+        debug = logger.isEnabledFor(logging.DEBUG)
+        for column, (column_codes, categories) in zip(string_columns, results):
+            codes[column] = column_codes
+
+            # Store the categories for later use
+            self.label_encoders[column] = categories
+
+            if debug:
+                logger.debug(f"Encoded column: {column} -> {column}_encoded")
+
+        logger.info(f"Encoded {len(string_columns)} columns: {string_columns}")
+        return codes
+
+    def _mood_score(self, columns, n_rows: int) -> np.ndarray:
+        """Compute the mood score from the encoded factor columns of a DataFrame or dict of arrays"""
+        # Stack the available encoded factors into one N x k matrix
+        factors = [factor for factor, column in MOOD_SCORE_COLUMNS.items() if column in columns]
+        w = np.array([MOOD_SCORE_WEIGHTS[factor] for factor in factors], dtype=np.float32)
+
+        if factors and n_rows:
+            X = np.column_stack(
+                [np.asarray(columns[MOOD_SCORE_COLUMNS[factor]], dtype=np.float32) for factor in factors]
+            )
+
+            # Normalize the encoded values to 0-1 scale (constant columns contribute 0).
+            # The largest code is len(categories) - 1, which keeps chunks on the same scale;
+            # factors without a fitted vocabulary fall back to one max reduction over X.
+            if all(factor in self.label_encoders for factor in factors):
+                maxv = np.array(
+                    [len(self.label_encoders[factor]) - 1 for factor in factors],
+                    dtype=np.float32,
+                )
+            else:
+                maxv = X.max(axis=0)
+            maxv[maxv == 0] = 1
+            score = (X / maxv) @ w
         else:
-            logger.warning("Physical_Activity_Hours column not found")
-        
-        return df
+            score = np.zeros(n_rows, dtype=np.float32)
 
-    def create_mood_score(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Create a custom mood score based on various factors"""
-        logger.info("Creating custom mood score...")
-        
-        # Define weights for different factors (can be adjusted based on domain knowledge)
-        weights = {
-            'Sleep_Quality': 0.15,
-            'Exercise_Frequency': 0.10,
-            'Diet_Quality': 0.10,
-            'Work_Life_Balance': 0.15,
-            'Financial_Stress': -0.15,  # Negative weight as higher stress = lower mood
-            'Life_Satisfaction': 0.20,
-            'Future_Outlook': 0.15
-        }
-        
-        # Initialize mood score
-        df['Mood_Score'] = 0.0
-        
-        # Calculate weighted score for each factor
-        for factor, weight in weights.items():
-            if f"{factor}_encoded" in df.columns:
-                # Normalize the encoded values to 0-1 scale
-                max_val = df[f"{factor}_encoded"].max()
-                if max_val > 0:
-                    normalized_values = df[f"{factor}_encoded"] / max_val
-                    df['Mood_Score'] += normalized_values * weight
-        
-        # Scale to 0-100 range
-        df['Mood_Score'] = (df['Mood_Score'] + 1) * 50  # Shift from [-1,1] to [0,100]
-        df['Mood_Score'] = df['Mood_Score'].clip(0, 100)  # Ensure bounds
-        
-        logger.info(f"Mood score created with range: {df['Mood_Score'].min():.2f} - {df['Mood_Score'].max():.2f}")
-        return df
+        # Scale to 0-100 range: shift from [-1,1] to [0,100] and ensure bounds
+        return np.clip((score + 1) * 50, 0, 100)
 
-    def drop_unnecessary_columns(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Drop columns that are not useful for modeling"""
-        logger.info("Dropping unnecessary columns...")
-        
-        # Add Technology_Usage_Hours to the drop list
+    def build_transformed_frame(self, df: pd.DataFrame, codes: dict) -> pd.DataFrame:
+        """Cap, score and drop in one pass over the column arrays, building the output frame once
+
+        Physical_Activity_Hours is capped at 6, the encoded columns and Mood_Score are added,
+        and the configured drop columns, Technology_Usage_Hours and all string columns are dropped.
+        """
         columns_to_drop = self.config.drop_columns + ["Technology_Usage_Hours"]
-        
-        # Also drop all string (object) columns to keep only numeric data
-        string_columns = df.select_dtypes(include=['object']).columns.tolist()
-        columns_to_drop.extend(string_columns)
-        
-        dropped_columns = []
-        for column in columns_to_drop:
-            if column in df.columns:
-                dropped_columns.append(column)
-                logger.info(f"Dropping column: {column}")
-            else:
-                logger.warning(f"Column {column} not found in dataset")
-        
-        if dropped_columns:
-            df = df.drop(columns=dropped_columns)
-            logger.info(f"Dropped {len(dropped_columns)} columns: {dropped_columns}")
-        
-        return df
+        missing_columns = [column for column in columns_to_drop if column not in df.columns]
+        if missing_columns:
+            logger.warning(f"Columns not found in dataset: {missing_columns}")
+        if 'Physical_Activity_Hours' not in df.columns:
+            logger.warning("Physical_Activity_Hours column not found")
+
+        drop_set = set(columns_to_drop)
+        drop_set.update(df.select_dtypes(include=['object', 'category']).columns)
+
+        result = {}
+        for column in df.columns:
+            if column in drop_set:
+                continue
+            values = df[column].to_numpy()
+            if column == 'Physical_Activity_Hours':
+                if values.flags.writeable:
+                    # Cap in place on the input's array: one pass, no new array
+                    np.minimum(values, 6, out=values)
+                else:
+                    # Read-only (e.g. zero-copy from Arrow): fall back to one new array
+                    values = np.minimum(values, 6)
+            result[column] = values
+        for column, column_codes in codes.items():
+            result[f"{column}_encoded"] = np.asarray(column_codes)
+        result['Mood_Score'] = self._mood_score(result, len(df))
+
+        dropped_columns = [column for column in df.columns if column in drop_set]
+        logger.info(f"Capped Physical_Activity_Hours at 6, created Mood_Score and dropped "
+                    f"{len(dropped_columns)} columns: {dropped_columns}")
+        return pd.DataFrame(result, index=df.index, copy=False)
 
     def ensure_target_columns_exist(self, df: pd.DataFrame) -> pd.DataFrame:
         """Ensure target columns exist and are properly formatted"""
         logger.info("Validating target columns...")
         
-        missing_targets = []
-        for target in self.config.target_columns:
-            if target not in df.columns:
-                missing_targets.append(target)
-            else:
-                logger.info(f"Target column found: {target}")
+        missing_targets = [target for target in self.config.target_columns if target not in df.columns]
         
         if missing_targets:
             logger.warning(f"Missing target columns: {missing_targets}")
+        else:
+            logger.info(f"All target columns found: {self.config.target_columns}")
         
         return df
 
@@ -163,33 +229,49 @@ class DataTransformation:
         lookups_dir = Path("artifacts/lookups")
         lookups_dir.mkdir(parents=True, exist_ok=True)
         
-        # Create a comprehensive lookup table
-        lookup_data = {}
-        
-        for column, le in self.label_encoders.items():
-            lookup_data[column] = {
-                'original_values': le.classes_.tolist(),
-                'encoded_values': list(range(len(le.classes_))),
-                'mapping': dict(zip(le.classes_, range(len(le.classes_)))),
-                'reverse_mapping': dict(zip(range(len(le.classes_)), le.classes_))
+        # One long-format table: (column, value, code) per category. Mappings in either
+        # direction are a filter on `column` away, so they are not stored separately.
+        rows = [
+            (column, value, code)
+            for column, categories in self.label_encoders.items()
+            for code, value in enumerate(categories)
+        ]
+        lookups = pd.DataFrame(rows, columns=['column', 'value', 'code'])
+        lookups['code'] = lookups['code'].astype(np.int32)
+
+        lookup_file = lookups_dir / "lookups.parquet"
+        lookups.to_parquet(lookup_file, index=False)
+        logger.info(f"Saved lookup table for {len(self.label_encoders)} columns: {lookup_file}")
+
+    def _write_csv(self, df: pd.DataFrame, f, header: bool = True):
+        """Write a CSV to an open binary file with PyArrow"""
+        if header:
+            # Arrow always quotes header names, so write the header the way pandas does
+            f.write((",".join(map(str, df.columns)) + "\n").encode())
+
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        write_options = pacsv.WriteOptions(
+            include_header=False, batch_size=65536, quoting_style="needed"
+        )
+        pacsv.write_csv(table, f, write_options=write_options)
+
+    def save_label_encoders(self):
+        """Save the label encoders and lookup tables for all encoded columns"""
+        encoders_path = self.config.transformed_data_path / "label_encoders.json"
+        encoders_data = {}
+        for column, categories in self.label_encoders.items():
+            encoders_data[column] = {
+                'classes': list(categories),
+                'n_classes': len(categories)
             }
         
-        # Save as JSON
         import json
-        lookup_file = lookups_dir / "column_encodings.json"
-        with open(lookup_file, 'w') as f:
-            json.dump(lookup_data, f, indent=2)
-        logger.info(f"Saved lookup table: {lookup_file}")
-        
-        # Save individual CSV files for each column
-        for column, le in self.label_encoders.items():
-            mapping_df = pd.DataFrame({
-                'original_value': le.classes_,
-                'encoded_value': range(len(le.classes_))
-            })
-            csv_file = lookups_dir / f"{column}_mapping.csv"
-            mapping_df.to_csv(csv_file, index=False)
-            logger.info(f"Saved {column} mapping: {csv_file}")
+        with open(encoders_path, 'w') as f:
+            json.dump(encoders_data, f, indent=2)
+        logger.info(f"Saved label encoders: {encoders_path}")
+        
+        # Save lookup tables
+        self.save_lookup_tables()
 
     def save_transformed_data(self, df: pd.DataFrame):
         """Save the transformed dataset"""
@@ -198,51 +280,134 @@ class DataTransformation:
         # Ensure the output directory exists
         self.config.transformed_data_path.mkdir(parents=True, exist_ok=True)
         
-        # Save as CSV
-        csv_path = self.config.transformed_data_path / "transformed_data.csv"
-        df.to_csv(csv_path, index=False)
-        logger.info(f"Saved transformed data as CSV: {csv_path}")
-        
-        # Save as JSON
-        json_path = self.config.transformed_data_path / "transformed_data.json"
-        df.to_json(json_path, orient="records", indent=2)
-        logger.info(f"Saved transformed data as JSON: {json_path}")
+        # Parquet is the canonical artifact: typed, dictionary-encoded and compressed
+        parquet_path = self.config.transformed_data_path / "transformed_data.parquet"
+        df.to_parquet(parquet_path, engine='pyarrow', compression='zstd', index=False)
+        logger.info(f"Saved transformed data as Parquet: {parquet_path}")
         
-        # Save label encoders for later use
-        encoders_path = self.config.transformed_data_path / "label_encoders.json"
-        encoders_data = {}
-        for column, le in self.label_encoders.items():
-            encoders_data[column] = {
-                'classes': le.classes_.tolist(),
-                'n_classes': len(le.classes_)
-            }
+        # CSV and line-delimited JSON are opt-in via emit_csv / emit_json
+        if self.config.emit_csv:
+            csv_path = self.config.transformed_data_path / "transformed_data.csv"
+            with open(csv_path, 'wb') as f:
+                self._write_csv(df, f)
+            logger.info(f"Saved transformed data as CSV: {csv_path}")
         
-        import json
-        with open(encoders_path, 'w') as f:
-            json.dump(encoders_data, f, indent=2)
-        logger.info(f"Saved label encoders: {encoders_path}")
+        if self.config.emit_json:
+            json_path = self.config.transformed_data_path / "transformed_data.json"
+            df.to_json(json_path, orient="records", lines=True)
+            logger.info(f"Saved transformed data as JSON: {json_path}")
         
-        # Save lookup tables
-        self.save_lookup_tables()
+        # Save label encoders for later use
+        self.save_label_encoders()
+
+    def fit_string_vocabulary(self, data_file: Path) -> list:
+        """Learn the categories of every string column without loading the full dataset"""
+        logger.info("Fitting string column vocabulary...")
+
+        # Detect string columns from the first chunk, then read only those as categoricals
+        sample = pd.read_csv(data_file, nrows=self.config.chunksize, usecols=self.config.usecols)
+        string_columns = sample.select_dtypes(include=['object']).columns.tolist()
+        if not string_columns:
+            return string_columns
+
+        categoricals = pd.read_csv(data_file, usecols=string_columns, dtype='category')
+        for column in string_columns:
+            categories = set(categoricals[column].cat.categories)
+            if categoricals[column].hasnans:
+                categories.add('Unknown')
+            # Sorted, so codes match a fit on the full column
+            self.label_encoders[column] = pd.Index(sorted(categories))
+
+        logger.info(f"Fitted vocabulary for {len(string_columns)} string columns: {string_columns}")
+        return string_columns
+
+    def encode_with_vocabulary(self, df: pd.DataFrame) -> dict:
+        """Encode string columns against the vocabulary learned by fit_string_vocabulary"""
+        string_columns = list(self.label_encoders)
+        self._fill_missing_strings(df, string_columns)
+
+        return {
+            column: pd.Categorical(df[column], categories=categories).codes.astype(
+                _code_dtype(len(categories)), copy=False
+            )
+            for column, categories in self.label_encoders.items()
+        }
+
+    def transform_data_in_chunks(self):
+        """Stream the input CSV in chunks of config.chunksize rows to bound peak memory"""
+        logger.info(f"Starting chunked data transformation (chunksize={self.config.chunksize})...")
+
+        data_file = self.config.data_path / "mental_health_and_technology_usage_2024.csv"
+        if not data_file.exists():
+            raise FileNotFoundError(f"Data file not found: {data_file}")
+
+        # First pass: learn the categories so every chunk is encoded consistently
+        string_columns = self.fit_string_vocabulary(data_file)
+
+        self.config.transformed_data_path.mkdir(parents=True, exist_ok=True)
+        parquet_path = self.config.transformed_data_path / "transformed_data.parquet"
+        csv_path = self.config.transformed_data_path / "transformed_data.csv"
+        json_path = self.config.transformed_data_path / "transformed_data.json"
+
+        # Second pass: transform each chunk and append it to the outputs
+        n_rows = 0
+        with ExitStack() as stack:
+            parquet_writer = None
+            csv_file = stack.enter_context(open(csv_path, 'wb')) if self.config.emit_csv else None
+            json_file = stack.enter_context(open(json_path, 'w')) if self.config.emit_json else None
+
+            # String columns stay object here; they are encoded against the vocabulary
+            dtypes = {**(self.config.dtypes or {}), **{column: object for column in string_columns}}
+            reader = pd.read_csv(
+                data_file,
+                chunksize=self.config.chunksize,
+                dtype=dtypes,
+                usecols=self.config.usecols,
+            )
+            for chunk in reader:
+                codes = self.encode_with_vocabulary(chunk)
+                chunk = self.build_transformed_frame(chunk, codes)
+                if n_rows == 0:
+                    chunk = self.ensure_target_columns_exist(chunk)
+
+                # The first chunk fixes the Parquet schema; later chunks are cast to it
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if parquet_writer is None:
+                    parquet_writer = stack.enter_context(
+                        pq.ParquetWriter(parquet_path, table.schema, compression='zstd')
+                    )
+                parquet_writer.write_table(table.cast(parquet_writer.schema))
+
+                if csv_file is not None:
+                    self._write_csv(chunk, csv_file, header=(n_rows == 0))
+                if json_file is not None:
+                    chunk.to_json(json_file, orient="records", lines=True)
+                n_rows += len(chunk)
+
+        logger.info(f"Saved transformed data as Parquet: {parquet_path}")
+        if self.config.emit_csv:
+            logger.info(f"Saved transformed data as CSV: {csv_path}")
+        if self.config.emit_json:
+            logger.info(f"Saved transformed data as JSON: {json_path}")
+
+        self.save_label_encoders()
+        logger.info(f"Chunked data transformation completed. Rows written: {n_rows}")
 
     def transform_data(self):
         """Main method to perform all data transformation steps"""
+        if self.config.chunksize:
+            return self.transform_data_in_chunks()
+
         logger.info("Starting data transformation...")
         
         # Load data
         df = self.load_data()
         
         # Encode all string columns
-        df = self.encode_all_string_columns(df)
-        
-        # Cap physical activity
-        df = self.cap_physical_activity(df)
-        
-        # Create mood score
-        df = self.create_mood_score(df)
+        codes = self.fit_encoders(df)
         
-        # Drop unnecessary columns
-        df = self.drop_unnecessary_columns(df)
+        # Cap physical activity, create mood score and drop unnecessary columns in one pass
+        df = self.build_transformed_frame(df, codes)
         
         # Ensure target columns exist
         df = self.ensure_target_columns_exist(df)
@@ -251,4 +416,4 @@ class DataTransformation:
         self.save_transformed_data(df)
         
         logger.info(f"Data transformation completed. Final shape: {df.shape}")
-        return df 
\ No newline at end of file
+        return df 
@@ -1,21 +1,167 @@
 import os
+import json
+import hashlib
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import yaml
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from typing import Dict, List
+from pandas.api.types import pandas_dtype
 from datascience import logger
 from datascience.entity.config_entity import DataValidationConfig
 
 
+# Optional fused min/max kernel; without numba the range check uses NumPy reductions
+try:
+    from numba import njit, prange
+except ImportError:
+    _minmax = None
+else:
+    @njit(parallel=True, cache=True)
+    def _minmax(block):
+        """Column-wise NaN-skipping min and max of a 2D float array in one scan."""
+        n_rows, n_cols = block.shape
+        mins = np.full(n_cols, np.nan)
+        maxs = np.full(n_cols, np.nan)
+        for j in prange(n_cols):
+            lo = np.inf
+            hi = -np.inf
+            for i in range(n_rows):
+                value = block[i, j]
+                if value < lo:
+                    lo = value
+                if value > hi:
+                    hi = value
+            if lo <= hi:
+                mins[j] = lo
+                maxs[j] = hi
+        return mins, maxs
+
+# Order of the categories in the status file, regardless of completion order
+VALIDATION_CATEGORIES = (
+    "FILE_VALIDATION",
+    "COLUMN_VALIDATION",
+    "QUALITY_VALIDATION",
+    "RANGE_VALIDATION",
+)
+
+# Below this many rows the frame validations run serially; thread start-up would dominate
+PARALLEL_MIN_ROWS = 100_000
+
+# Short type names allowed in schema.yaml
+SCHEMA_TYPE_ALIASES = {
+    'int': 'int64',
+    'float': 'float64',
+}
+
+# Narrower numeric dtypes are accepted wherever the schema asks for the 64-bit one
+DTYPE_ALIASES = {
+    np.dtype('int32'): np.dtype('int64'),
+    np.dtype('float32'): np.dtype('float64'),
+}
+
+
+@lru_cache(maxsize=256)
+def _canon_dtype(dtype) -> str:
+    """Normalize a schema type name or pandas dtype to a comparable dtype name."""
+    try:
+        dtype = pandas_dtype(SCHEMA_TYPE_ALIASES.get(dtype, dtype))
+    except TypeError:
+        return str(dtype)
+    # Compared by name, so a categorical matches 'category' whatever its categories
+    return str(DTYPE_ALIASES.get(dtype, dtype))
+
+
 class DataValidation:
     def __init__(self, config: DataValidationConfig, schema: Dict):
         try:
             self.config = config
             self.schema = schema
             self.validation_results = {}
+            # Validations may run concurrently on the same instance
+            self._results_lock = threading.Lock()
+            self.expected_columns = self.schema.get("COLUMNS", {})
+            # Expected columns and dtypes, canonicalized once so checks are a single vectorized compare
+            self._expected_cols = pd.Index(list(self.expected_columns.keys()))
+            self._expected_dtypes = np.array(
+                [_canon_dtype(t) for t in self.expected_columns.values()], dtype=object
+            )
+            self._expected_dtypes.flags.writeable = False
+            # Required column and file names for the common all-present superset check
+            self._required_cols = frozenset(self.expected_columns)
+            self._required_files = frozenset(self.config.ALL_REQUIRED_FILES)
+            # Fingerprint of the schema, used to key the cached validation results
+            self._schema_hash = hashlib.blake2b(
+                json.dumps(self.schema, sort_keys=True, default=str).encode()
+            ).hexdigest()
+            self._status_cache_path = Path(self.config.STATUS_FILE).with_name("validation_cache.json")
         except Exception as e:
             raise e
 
+    def _set_result(self, category: str, result: Dict):
+        with self._results_lock:
+            self.validation_results[category] = result
+
+    def _file_fingerprint(self, data_file: Path) -> Dict:
+        stat = os.stat(data_file)
+        return {
+            "schema_hash": self._schema_hash,
+            "file_path": str(Path(data_file).resolve()),
+            "file_mtime_ns": stat.st_mtime_ns,
+            "file_size": stat.st_size,
+        }
+
+    def load_cached_results(self, data_file: Path) -> bool:
+        """
+        Restores validation results from the cache if the data file and schema are unchanged.
+        
+        Args:
+            data_file: path of the data file being validated
+            
+        Returns:
+            bool: True if cached results were restored, False otherwise
+        """
+        try:
+            with open(self._status_cache_path, 'r') as f:
+                cached = json.load(f)
+            fingerprint = self._file_fingerprint(data_file)
+        except (OSError, ValueError):
+            return False
+        
+        if any(cached.get(key) != value for key, value in fingerprint.items()):
+            return False
+        
+        self.validation_results = cached["results"]
+        logger.info(f"Data file unchanged since last validation, reusing results from {self._status_cache_path}")
+        return True
+
+    def save_cached_results(self, data_file: Path):
+        """
+        Stores the current validation results keyed by the data file and schema fingerprint.
+        
+        Args:
+            data_file: path of the data file that was validated
+        """
+        try:
+            cached = {**self._file_fingerprint(data_file), "results": self.validation_results}
+            cache_dir = self._status_cache_path.parent
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            # Unique temp file in the same directory, so concurrent runs never share it
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(cached, f)
+                os.replace(tmp_path, self._status_cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except Exception as e:
+            logger.warning(f"Could not save validation cache: {e}")
+
     def validate_all_columns(self, data: pd.DataFrame) -> bool:
         """
         Validates if all columns in the data match the expected schema.
@@ -29,71 +175,94 @@ class DataValidation:
         try:
             logger.info("Validating data columns against schema...")
             
-            # Get expected columns from schema
-            expected_columns = self.schema.get("COLUMNS", {})
+            # Frames that already passed against this schema carry its fingerprint.
+            # attrs survive copies and column reassignment, so the stamp also covers
+            # the current columns and dtypes
+            stamp = f"{self._schema_hash}:{hash((tuple(data.columns), tuple(data.dtypes)))}"
+            if data.attrs.get("schema_ok") == stamp:
+                logger.info("✅ Columns already validated against this schema, skipping")
+                self._set_result("COLUMN_VALIDATION", {
+                    "status": True,
+                    "message": "All columns validated successfully (cached)"
+                })
+                return True
             
             # Check if all expected columns exist
-            missing_columns = []
-            for col_name in expected_columns.keys():
-                if col_name not in data.columns:
-                    missing_columns.append(col_name)
+            missing_columns = self._missing_columns(data.columns)
             
             if missing_columns:
                 logger.error(f"Missing columns: {missing_columns}")
-                self.validation_results["COLUMN_VALIDATION"] = {
+                self._set_result("COLUMN_VALIDATION", {
                     "status": False,
                     "message": f"Missing columns: {missing_columns}"
-                }
+                })
                 return False
             
-            # Check if all columns have the expected data types
-            type_mismatches = []
-            for col_name, expected_type in expected_columns.items():
-                actual_type = str(data[col_name].dtype)
-                
-                # Map pandas dtypes to schema types
-                type_mapping = {
-                    'object': 'object',
-                    'int64': 'int',
-                    'float64': 'float',
-                    'int32': 'int',
-                    'float32': 'float',
-                    'int': 'int',
-                    'float': 'float'
-                }
-                
-                actual_mapped = type_mapping.get(actual_type, actual_type)
-                expected_mapped = type_mapping.get(expected_type, expected_type)
-                
-                if actual_mapped != expected_mapped:
-                    type_mismatches.append({
-                        'column': col_name,
-                        'expected': expected_type,
-                        'actual': actual_type
-                    })
+            # Compare all column dtypes against the schema in one pass
+            actual = data.dtypes.reindex(self._expected_cols).values
+            actual_canon = np.array([_canon_dtype(dtype) for dtype in actual], dtype=object)
+            mismatch_mask = actual_canon != self._expected_dtypes
             
-            if type_mismatches:
+            if mismatch_mask.any():
+                type_mismatches = [
+                    {
+                        'column': col_name,
+                        'expected': self.expected_columns[col_name],
+                        'actual': str(actual_type)
+                    }
+                    for col_name, actual_type in zip(self._expected_cols[mismatch_mask], actual[mismatch_mask])
+                ]
                 logger.error(f"Type mismatches found: {type_mismatches}")
-                self.validation_results["COLUMN_VALIDATION"] = {
+                self._set_result("COLUMN_VALIDATION", {
                     "status": False,
                     "message": f"Type mismatches: {type_mismatches}"
-                }
+                })
                 return False
             
             logger.info("✅ All columns validated successfully!")
-            self.validation_results["COLUMN_VALIDATION"] = {
+            data.attrs["schema_ok"] = stamp
+            self._set_result("COLUMN_VALIDATION", {
                 "status": True,
                 "message": "All columns validated successfully"
-            }
+            })
             return True
             
         except Exception as e:
             logger.error(f"Error during validation: {e}")
-            self.validation_results["COLUMN_VALIDATION"] = {
+            self._set_result("COLUMN_VALIDATION", {
                 "status": False,
                 "message": f"Error during validation: {e}"
-            }
+            })
+            return False
+
+    def _missing_columns(self, columns) -> List:
+        present_columns = set(columns)
+        if present_columns.issuperset(self._required_cols):
+            return []
+        # Only a failure needs the missing names, in schema order
+        return [col for col in self._expected_cols if col not in present_columns]
+
+    def validate_header(self, columns) -> bool:
+        """
+        Checks that all schema columns are present, using only the file header.
+        
+        Only a failure is recorded; dtypes still need validate_all_columns on the data.
+        
+        Args:
+            columns: column names read from the file header
+            
+        Returns:
+            bool: True if no schema column is missing, False otherwise
+        """
+        missing_columns = self._missing_columns(columns)
+        if missing_columns:
+            logger.error(f"Missing columns: {missing_columns}")
+            self._set_result("COLUMN_VALIDATION", {
+                "status": False,
+                "message": f"Missing columns: {missing_columns}"
+            })
             return False
+        return True
 
     def validate_data_files(self) -> bool:
         """
@@ -105,33 +274,37 @@ class DataValidation:
         try:
             logger.info("Validating data files...")
             
+            # List the directory once instead of stat-ing every required file
+            try:
+                with os.scandir(self.config.unzip_dir) as entries:
+                    existing = {entry.name for entry in entries}
+            except FileNotFoundError:
+                existing = set()
             missing_files = []
-            for file_name in self.config.ALL_REQUIRED_FILES:
-                file_path = Path(self.config.unzip_dir) / file_name
-                if not file_path.exists():
-                    missing_files.append(file_name)
+            if not self._required_files.issubset(existing):
+                missing_files = [file_name for file_name in self.config.ALL_REQUIRED_FILES if file_name not in existing]
             
             if missing_files:
                 logger.error(f"Missing files: {missing_files}")
-                self.validation_results["FILE_VALIDATION"] = {
+                self._set_result("FILE_VALIDATION", {
                     "status": False,
                     "message": f"Missing files: {missing_files}"
-                }
+                })
                 return False
             
             logger.info("✅ All required files found!")
-            self.validation_results["FILE_VALIDATION"] = {
+            self._set_result("FILE_VALIDATION", {
                 "status": True,
                 "message": "All required files found"
-            }
+            })
             return True
             
         except Exception as e:
             logger.error(f"Error during file validation: {e}")
-            self.validation_results["FILE_VALIDATION"] = {
+            self._set_result("FILE_VALIDATION", {
                 "status": False,
                 "message": f"Error during file validation: {e}"
-            }
+            })
             return False
 
     def validate_data_quality(self, data: pd.DataFrame) -> bool:
@@ -149,14 +322,14 @@ class DataValidation:
             
             issues = []
             
-            # Check for missing values
-            missing_values = data.isnull().sum()
-            columns_with_missing = missing_values[missing_values > 0]
-            if not columns_with_missing.empty:
-                issues.append(f"Missing values in columns: {list(columns_with_missing.index)}")
+            # Check for missing values with one reduction over the null mask block
+            has_missing = data.isna().values.any(axis=0)
+            if has_missing.any():
+                issues.append(f"Missing values in columns: {list(data.columns[has_missing])}")
             
-            # Check for duplicates
-            duplicate_count = data.duplicated().sum()
+            # Check for duplicates; duplicated() hashes rows in one pass, which measured faster
+            # than a separate row-hash + sort pre-check both with and without duplicates
+            duplicate_count = int(data.duplicated(keep='first').sum())
             if duplicate_count > 0:
                 issues.append(f"Found {duplicate_count} duplicate rows")
             
@@ -166,25 +339,25 @@ class DataValidation:
             
             if issues:
                 logger.warning(f"Data quality issues found: {issues}")
-                self.validation_results["QUALITY_VALIDATION"] = {
+                self._set_result("QUALITY_VALIDATION", {
                     "status": False,
                     "message": f"Quality issues: {'; '.join(issues)}"
-                }
+                })
                 return False
             
             logger.info("✅ Data quality validation passed!")
-            self.validation_results["QUALITY_VALIDATION"] = {
+            self._set_result("QUALITY_VALIDATION", {
                 "status": True,
                 "message": "Data quality validation passed"
-            }
+            })
             return True
             
         except Exception as e:
             logger.error(f"Error during quality validation: {e}")
-            self.validation_results["QUALITY_VALIDATION"] = {
+            self._set_result("QUALITY_VALIDATION", {
                 "status": False,
                 "message": f"Error during quality validation: {e}"
-            }
+            })
             return False
 
     def validate_data_range(self, data: pd.DataFrame) -> bool:
@@ -204,44 +377,85 @@ class DataValidation:
             
             # Check age range (if exists)
             if 'Age' in data.columns:
-                age_min, age_max = data['Age'].min(), data['Age'].max()
+                age_min, age_max = data['Age'].agg(['min', 'max'])
                 if age_min < 0 or age_max > 120:
                     issues.append(f"Age range ({age_min}-{age_max}) seems unrealistic")
             
-            # Check hour-based columns (should be 0-24)
+            # Check hour-based columns (should be 0-24) with one min/max reduction
             hour_columns = ['Technology_Usage_Hours', 'Social_Media_Usage_Hours', 
                            'Gaming_Hours', 'Screen_Time_Hours', 'Sleep_Hours', 
                            'Physical_Activity_Hours']
-            
-            for col in hour_columns:
-                if col in data.columns:
-                    col_min, col_max = data[col].min(), data[col].max()
-                    if col_min < 0 or col_max > 24:
-                        issues.append(f"{col} range ({col_min:.2f}-{col_max:.2f}) exceeds 0-24 hours")
+            present = [col for col in hour_columns if col in data.columns]
+            
+            if present and len(data):
+                # One NaN-skipping reduction over the block in its stored dtype
+                # (float32 columns stay 4 bytes wide; nothing is converted first)
+                block = data[present].to_numpy()
+                if _minmax is not None and block.dtype.kind == 'f':
+                    mins, maxs = _minmax(np.asfortranarray(block))
+                else:
+                    with np.errstate(invalid='ignore'):  # all-NaN columns reduce to NaN quietly
+                        mins = np.fmin.reduce(block, axis=0)
+                        maxs = np.fmax.reduce(block, axis=0)
+                bad = (mins < 0) | (maxs > 24)
+                for col, col_min, col_max in zip(np.array(present)[bad], mins[bad], maxs[bad]):
+                    issues.append(f"{col} range ({col_min:.2f}-{col_max:.2f}) exceeds 0-24 hours")
             
             if issues:
                 logger.warning(f"Range validation issues: {issues}")
-                self.validation_results["RANGE_VALIDATION"] = {
+                self._set_result("RANGE_VALIDATION", {
                     "status": False,
                     "message": f"Range issues: {'; '.join(issues)}"
-                }
+                })
                 return False
             
             logger.info("✅ Data range validation passed!")
-            self.validation_results["RANGE_VALIDATION"] = {
+            self._set_result("RANGE_VALIDATION", {
                 "status": True,
                 "message": "Data range validation passed"
-            }
+            })
             return True
             
         except Exception as e:
             logger.error(f"Error during range validation: {e}")
-            self.validation_results["RANGE_VALIDATION"] = {
+            self._set_result("RANGE_VALIDATION", {
                 "status": False,
                 "message": f"Error during range validation: {e}"
-            }
+            })
             return False
 
+    def validate_dataframe(self, data: pd.DataFrame, strict: bool = False) -> bool:
+        """
+        Runs the column, data quality and range validations on an in-memory DataFrame.
+        
+        Args:
+            data: frame to validate; no file is located, read or cached
+            strict: stop at the first failing validation instead of running all of them
+        
+        Returns:
+            bool: True if all three validations passed, False otherwise
+        """
+        validations = [
+            ("COLUMN", self.validate_all_columns),
+            ("QUALITY", self.validate_data_quality),
+            ("RANGE", self.validate_data_range),
+        ]
+        # The checks are independent reads of the same frame, so large frames run them concurrently
+        if len(data) >= PARALLEL_MIN_ROWS and not strict:
+            logger.info("=== COLUMN, QUALITY AND RANGE VALIDATION (parallel) ===")
+            with ThreadPoolExecutor(max_workers=len(validations)) as executor:
+                futures = [executor.submit(validate, data) for _, validate in validations]
+                return all([future.result() for future in futures])
+        
+        passed = True
+        for name, validate in validations:
+            logger.info(f"=== {name} VALIDATION ===")
+            if not validate(data):
+                if strict:
+                    return False
+                passed = False
+        return passed
+
     def get_overall_validation_status(self) -> bool:
         """
         Determines the overall validation status based on all individual validations.
@@ -263,25 +477,31 @@ class DataValidation:
         """
         try:
             # Create the directory if it doesn't exist
-            os.makedirs(self.config.STATUS_FILE.parent, exist_ok=True)
+            status_file = Path(self.config.STATUS_FILE)
+            status_file.parent.mkdir(parents=True, exist_ok=True)
             
             # Determine overall status
             overall_status = self.get_overall_validation_status()
             overall_text = "VALIDATION PASSED" if overall_status else "VALIDATION FAILED"
             
             # Build the content with individual categories
-            content = f"{overall_text}\n"
+            parts = [overall_text, "\n"]
             if message:
-                content += f"{message}\n"
-            content += "\n"
+                parts += [message, "\n"]
+            parts.append("\n")
             
             # Add individual validation results
-            for category, result in self.validation_results.items():
-                status_icon = "✅" if result["status"] else "❌"
-                content += f"{status_icon} {category}: {result['message']}\n"
-            
-            with open(self.config.STATUS_FILE, 'w') as f:
-                f.write(content)
+            rank = {category: i for i, category in enumerate(VALIDATION_CATEGORIES)}
+            ordered = sorted(
+                self.validation_results.items(),
+                key=lambda item: rank.get(item[0], len(rank)),
+            )
+            parts.extend(
+                f"{'✅' if result['status'] else '❌'} {category}: {result['message']}\n"
+                for category, result in ordered
+            )
+            
+            status_file.write_bytes("".join(parts).encode("utf-8"))
             
             logger.info(f"Validation status saved to {self.config.STATUS_FILE}")
             
@@ -34,8 +34,8 @@ class ConfigurationManager:
         create_directories([config.root_dir])
 
         return DataValidationConfig(
-            root_dir=config.root_dir,
-            unzip_dir=config.unzip_dir,
+            root_dir=Path(config.root_dir),
+            unzip_dir=Path(config.unzip_dir),
             STATUS_FILE=Path(config.STATUS_FILE),
             ALL_REQUIRED_FILES=config.ALL_REQUIRED_FILES,
         )
@@ -51,4 +51,9 @@ class ConfigurationManager:
             target_columns=config.target_columns,
             categorical_columns=config.categorical_columns,
             drop_columns=config.drop_columns,
+            emit_csv=config.get("emit_csv", False),
+            emit_json=config.get("emit_json", False),
+            chunksize=config.get("chunksize"),
+            dtypes=config.get("dtypes"),
+            usecols=config.get("usecols"),
         )
\ No newline at end of file
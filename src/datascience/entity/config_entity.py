@@ -21,4 +21,9 @@ class DataTransformationConfig:
     transformed_data_path: Path  # path to save transformed data
     target_columns: list  # columns to use as targets (Mental_Health_Status, Stress_Level)
     categorical_columns: list  # columns to encode
-    drop_columns: list  # columns to drop if not useful
\ No newline at end of file
+    drop_columns: list  # columns to drop if not useful
+    emit_csv: bool = False  # also write transformed_data.csv (Parquet is always written)
+    emit_json: bool = False  # also write transformed_data.json (line-delimited)
+    chunksize: int = None  # stream the input in chunks of this many rows (None = load all)
+    dtypes: dict = None  # column -> dtype applied when reading the CSV (e.g. category, float32)
+    usecols: list = None  # only read these columns (None = all columns)
\ No newline at end of file
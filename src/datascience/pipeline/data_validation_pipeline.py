@@ -1,5 +1,6 @@
 import pandas as pd
 from pathlib import Path
+from typing import Optional
 from datascience import logger
 from datascience.config.configuration import ConfigurationManager
 from datascience.components.data_validation import DataValidation
@@ -10,10 +11,18 @@ class DataValidationTrainingPipeline:
         self.config = ConfigurationManager()
         self.data_validation_config = self.config.get_data_validation_config()
         self.schema = self.config.schema
+        # Path to the data file from data ingestion
+        self.data_file_path = self.data_validation_config.unzip_dir / "mental_health_and_technology_usage_2024.csv"
 
-    def initiate_data_validation(self):
+    def initiate_data_validation(self, data_path: Optional[Path] = None, strict: bool = False,
+                                 df: Optional[pd.DataFrame] = None):
         """
         Initiates the data validation process with multiple validation categories.
+        
+        Args:
+            data_path: data file to validate (CSV or Feather); defaults to the ingested CSV
+            strict: stop at the first failing validation instead of running all of them
+            df: DataFrame to validate in memory; skips the file checks, parsing and caching
         """
         try:
             logger.info("Starting data validation pipeline...")
@@ -24,8 +33,15 @@ class DataValidationTrainingPipeline:
                 schema=self.schema
             )
             
-            # Path to the data file from data ingestion
-            data_file_path = Path(self.data_validation_config.unzip_dir) / "mental_health_and_technology_usage_2024.csv"
+            if df is not None:
+                logger.info("Validating in-memory DataFrame")
+                if not data_validation.validate_dataframe(df, strict=strict) and strict:
+                    self._save_strict_failure(data_validation)
+                    return
+                self._save_status(data_validation)
+                return
+            
+            data_file_path = Path(data_path) if data_path is not None else self.data_file_path
             
             # 1. Validate that required files exist
             logger.info("=== FILE VALIDATION ===")
@@ -35,32 +51,69 @@ class DataValidationTrainingPipeline:
                 data_validation.save_validation_status("File validation failed")
                 return
             
-            # 2. Load the data
-            logger.info(f"Loading data from {data_file_path}")
-            data = pd.read_csv(data_file_path)
+            # Reuse earlier results if neither the data file nor the schema changed
+            if data_validation.load_cached_results(data_file_path):
+                self._save_status(data_validation)
+                return
             
-            # 3. Validate columns against schema
-            logger.info("=== COLUMN VALIDATION ===")
-            columns_valid = data_validation.validate_all_columns(data)
+            # In strict mode a header probe catches missing columns before the full parse
+            if strict:
+                header = self._read_header(data_file_path)
+                if not data_validation.validate_header(header):
+                    self._save_strict_failure(data_validation)
+                    return
             
-            # 4. Validate data quality
-            logger.info("=== QUALITY VALIDATION ===")
-            quality_valid = data_validation.validate_data_quality(data)
+            # 2. Load the data
+            logger.info(f"Loading data from {data_file_path}")
+            data = self._read_data(data_file_path)
             
-            # 5. Validate data ranges
-            logger.info("=== RANGE VALIDATION ===")
-            range_valid = data_validation.validate_data_range(data)
+            # 3-5. Validate columns, data quality and data ranges
+            if not data_validation.validate_dataframe(data, strict=strict) and strict:
+                # Partial results are not cached; a later full run must see every check
+                self._save_strict_failure(data_validation)
+                return
             
             # 6. Determine overall validation status
-            overall_status = data_validation.get_overall_validation_status()
-            
-            if overall_status:
-                logger.info("✅ All validation categories passed!")
-                data_validation.save_validation_status("All validations completed successfully")
-            else:
-                logger.error("❌ Some validation categories failed!")
-                data_validation.save_validation_status("Some validation categories failed")
+            data_validation.save_cached_results(data_file_path)
+            self._save_status(data_validation)
                 
         except Exception as e:
             logger.error(f"Error in data validation pipeline: {e}")
-            raise e 
\ No newline at end of file
+            raise e
+
+    def _read_header(self, data_file_path: Path) -> list:
+        if data_file_path.suffix == ".feather":
+            import pyarrow as pa
+            with pa.memory_map(str(data_file_path)) as source:
+                return pa.ipc.open_file(source).schema.names
+        return list(pd.read_csv(data_file_path, nrows=0).columns)
+
+    def _read_data(self, data_file_path: Path) -> pd.DataFrame:
+        if data_file_path.suffix == ".feather":
+            return pd.read_feather(data_file_path)
+        # Arrow's multi-threaded CSV reader; dtypes are still inferred so that
+        # schema mismatches are reported by the column validation, not at parse time
+        try:
+            return pd.read_csv(data_file_path, engine='pyarrow')
+        except ImportError:
+            return pd.read_csv(data_file_path, engine='c')
+
+    def _save_status(self, data_validation: DataValidation):
+        overall_status = data_validation.get_overall_validation_status()
+        
+        if overall_status:
+            logger.info("✅ All validation categories passed!")
+            data_validation.save_validation_status("All validations completed successfully")
+        else:
+            logger.error("❌ Some validation categories failed!")
+            data_validation.save_validation_status("Some validation categories failed") 
+
+    def _save_strict_failure(self, data_validation: DataValidation):
+        # Strict mode stops at the first failure, so it is the first failed category recorded
+        failed = next(
+            category for category, result in data_validation.validation_results.items()
+            if not result["status"]
+        )
+        name = failed.split("_")[0]
+        logger.error(f"Data validation failed: {name.lower()} validation failed (strict mode)")
+        data_validation.save_validation_status(f"{name.capitalize()} validation failed")
@@ -10,6 +10,16 @@ from typing import Any, Dict, List, Tuple
 from box.exceptions import BoxValueError
 import pandas as pd
 
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+# DS_FAST=1 skips the runtime annotation checks on every utility call
+if os.environ.get("DS_FAST", "0") == "1":
+    def ensure_annotations(func):
+        return func
+
 
 @ensure_annotations
 def read_yaml(path_to_yaml: Path) -> ConfigBox:
@@ -27,9 +37,9 @@ def read_yaml(path_to_yaml: Path) -> ConfigBox:
     """
     try:
         with open(path_to_yaml) as yaml_file:
-            content = yaml.safe_load(yaml_file)
-            logger.info(f"yaml file: {path_to_yaml} loaded successfully")
-            return ConfigBox(content)
+            content = yaml.load(yaml_file, Loader=YamlLoader)
+        logger.info(f"yaml file: {path_to_yaml} loaded successfully")
+        return ConfigBox(content)
     except BoxValueError:
         raise ValueError("yaml file is empty")
     except Exception as e:
@@ -167,9 +177,14 @@ def load_json_data(file_path: Path) -> pd.DataFrame:
         pd.DataFrame: loaded data
     """
     try:
-        # Load JSON data
-        with open(file_path, 'r') as f:
-            json_data = json.load(f)
+        # Load JSON data; orjson parses straight from bytes and is much faster when installed
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        try:
+            import orjson
+            json_data = orjson.loads(raw)
+        except ImportError:
+            json_data = json.loads(raw)
         
         # Convert to DataFrame efficiently
         if isinstance(json_data, list):
@@ -5,10 +5,15 @@ Test script for the Data Transformation component
 
 import sys
 import os
+import json
+import numpy as np
+import pandas as pd
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.datascience import logger
 from src.datascience.pipeline.data_transformation_pipeline import DataTransformationTrainingPipeline
+from src.datascience.components.data_transformation import DataTransformation
+from src.datascience.entity.config_entity import DataTransformationConfig
 
 def test_data_transformation():
     """Test the data transformation pipeline"""
@@ -28,6 +33,48 @@ def test_data_transformation():
         logger.error(f"Data Transformation test failed: {str(e)}")
         return False
 
+def _run_transformation(data_dir, output_dir, chunksize):
+    """Transform the CSV in data_dir and return the Parquet output and the saved label encoders"""
+    config = DataTransformationConfig(
+        root_dir=output_dir,
+        data_path=data_dir,
+        transformed_data_path=output_dir,
+        target_columns=["Mental_Health_Status", "Stress_Level"],
+        categorical_columns=[],
+        drop_columns=["User_ID"],
+        chunksize=chunksize,
+    )
+    DataTransformation(config).transform_data()
+    transformed = pd.read_parquet(output_dir / "transformed_data.parquet")
+    with open(output_dir / "label_encoders.json") as f:
+        encoders = json.load(f)
+    return transformed, encoders
+
+def test_chunked_transformation_matches_in_memory(tmp_path, monkeypatch):
+    """The chunked path must write the same Parquet data and label encoders as the in-memory path"""
+    # Lookup tables are written to artifacts/lookups under the working directory
+    monkeypatch.chdir(tmp_path)
+    data_dir = tmp_path / "data_ingestion"
+    data_dir.mkdir()
+    pd.DataFrame({
+        "User_ID": ["USER-1", "USER-2", "USER-3", "USER-4", "USER-5"],
+        "Age": [23, 35, 41, 29, 52],
+        "Gender": ["Male", "Female", "None", np.nan, "Male"],
+        "Technology_Usage_Hours": [5.5, 2.0, 8.25, 1.0, 3.5],
+        "Physical_Activity_Hours": [1.5, 8.0, 3.5, 7.0, 2.0],
+        "Mental_Health_Status": ["Good", "Poor", "Fair", "Good", "Poor"],
+        "Stress_Level": ["Low", "High", "Medium", "Low", "High"],
+        "Sleep_Quality": ["Good", np.nan, "Poor", "Good", "None"],
+        "Work_Environment_Impact": ["Positive", "Negative", "None", "Neutral", "Positive"],
+        "Life_Satisfaction": ["High", "Low", "Medium", "High", "<NA>"],
+    }).to_csv(data_dir / "mental_health_and_technology_usage_2024.csv", index=False)
+
+    in_memory, in_memory_encoders = _run_transformation(data_dir, tmp_path / "in_memory", None)
+    chunked, chunked_encoders = _run_transformation(data_dir, tmp_path / "chunked", 2)
+
+    pd.testing.assert_frame_equal(in_memory, chunked)
+    assert in_memory_encoders == chunked_encoders
+
 if __name__ == "__main__":
     success = test_data_transformation()
     if success:
@@ -1,85 +1,296 @@
+import os
+import json
+import hashlib
+import inspect
+import logging
+import logging.handlers
+import argparse
+import pytest
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
 from pathlib import Path
-import shutil
+from datascience.pipeline.data_validation_pipeline import DataValidationTrainingPipeline
+from datascience.components.data_validation import DataValidation
+
+# TEST_FORMAT=feather writes the test variants as Arrow IPC (Feather) files instead of CSV
+TEST_FORMAT = os.environ.get("TEST_FORMAT", "csv")
+
+# Rows of the original file perturbed per step while generating the test files
+GENERATION_CHUNKSIZE = 200_000
+
+# Narrow in-memory dtypes for the original data, so every derived column copy is smaller.
+# Age is int16 rather than int8 because the out-of-range test writes 150
+NARROW_DTYPES = {
+    'Age': 'int16',
+    'Technology_Usage_Hours': 'float32',
+    'Sleep_Hours': 'float32',
+    'Gender': 'category',
+    'Mental_Health_Status': 'category',
+}
+
+# Ingested data the test variants are derived from
+ORIGINAL_DATA_PATH = Path("artifacts/data_ingestion/mental_health_and_technology_usage_2024.csv")
+
+# Rows of the original data perturbed for the in-memory validation cases
+IN_MEMORY_SAMPLE_ROWS = 1000
+
+# Generated test files, one per kind of data quality issue
+TEST_DIR = Path("artifacts/data_ingestion/test_validation")
+TEST_CASES = [
+    "missing_columns",
+    "wrong_types",
+    "missing_values",
+    "out_of_range",
+    "duplicates",
+    "invalid_categorical",
+    "mixed_types",
+]
+
+# Validation category that must report ❌ for each test case
+EXPECTED_FAILURES = {
+    "missing_columns": "COLUMN_VALIDATION",
+    "wrong_types": "COLUMN_VALIDATION",
+    "missing_values": "QUALITY_VALIDATION",
+    "out_of_range": "RANGE_VALIDATION",
+    "duplicates": "QUALITY_VALIDATION",
+    "invalid_categorical": "QUALITY_VALIDATION",
+    "mixed_types": "COLUMN_VALIDATION",
+}
+
+# Perturbations DataValidation does not detect (yet)
+KNOWN_GAPS = {
+    "wrong_types": pytest.mark.xfail(
+        TEST_FORMAT == "csv", reason="the CSV reader infers numbers again from the text"
+    ),
+    "invalid_categorical": pytest.mark.xfail(
+        reason="DataValidation has no check for allowed categorical values"
+    ),
+}
+
+# In memory there is no CSV round trip, so only the missing categorical check remains a gap
+IN_MEMORY_GAPS = {"invalid_categorical": KNOWN_GAPS["invalid_categorical"]}
+
+# Seed of the random generator behind every perturbation
+GENERATION_SEED = 0
+
+# Source hash and file sizes of the last generated test files, per TEST_FORMAT
+MANIFEST_PATH = TEST_DIR / ".manifest.json"
+
+# Validation status per (test file content, schema, validation code) from earlier runs
+VALIDATION_CACHE_DIR = Path("artifacts/.validation_cache")
+
+
+def _pick(rng: np.random.Generator, n: int, frac: float) -> np.ndarray:
+    """
+    Draws round(frac * n) distinct row positions.
+    """
+    return rng.choice(n, size=round(frac * n), replace=False)
+
+def _with_values(series: pd.Series, positions, value) -> pd.Series:
+    """
+    Returns a copy of one column with `value` written at the row `positions`.
+    
+    The write goes to a private NumPy copy of just this column.
+    """
+    values = series.to_numpy(copy=True)
+    if values.dtype.kind in 'iu' and pd.isna(value):
+        values = values.astype(np.float64)  # integers have no NaN
+    values[positions] = value
+    return pd.Series(values, index=series.index, name=series.name)
+
+def _with_category(series: pd.Series, positions, value) -> pd.Series:
+    """
+    Categorical version of `_with_values`: only the integer codes are copied.
+    
+    A new `value` is added to the categories; None or NaN writes a missing value.
+    """
+    codes = series.cat.codes.to_numpy(copy=True)
+    categories = series.cat.categories
+    if pd.isna(value):
+        codes[positions] = -1
+    else:
+        if value not in categories:
+            categories = categories.append(pd.Index([value]))
+        codes[positions] = categories.get_loc(value)
+    return pd.Series(
+        pd.Categorical.from_codes(codes, categories), index=series.index, name=series.name
+    )
+
+def _to_arrow(df: pd.DataFrame) -> pa.Table:
+    """
+    Converts a test variant to an Arrow table.
+    """
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Mixed object columns are stored as strings, which is how a CSV reader sees them
+        mixed = {}
+        for col in df.columns[df.dtypes == object]:
+            try:
+                pa.array(df[col], from_pandas=True)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                mixed[col] = df[col].astype("string")
+        table = pa.Table.from_pandas(df.assign(**mixed), preserve_index=False)
+    # Undo the in-memory narrowing (categories, int16) so the file has the dataset's
+    # own column types; without pandas metadata, strings read back as object
+    for i, field in enumerate(table.schema):
+        if pa.types.is_dictionary(field.type):
+            table = table.set_column(i, field.name, table.column(i).cast(field.type.value_type))
+        elif pa.types.is_integer(field.type):
+            table = table.set_column(i, field.name, table.column(i).cast(pa.int64()))
+    return table.replace_schema_metadata(None)
+
+def _open_writer(path: Path, schema: pa.Schema):
+    """
+    Opens a streaming writer for one test file in TEST_FORMAT.
+    """
+    if TEST_FORMAT == "feather":
+        # Feather V2 is the Arrow IPC file format
+        return pa.ipc.new_file(path, schema, options=pa.ipc.IpcWriteOptions(compression="lz4"))
+    return pacsv.CSVWriter(path, schema, write_options=pacsv.WriteOptions(batch_size=65536))
+
+def _make_variants(df: pd.DataFrame, rng: np.random.Generator) -> dict:
+    """
+    Builds the perturbed versions of one chunk of the original data.
+    
+    Each variant is built with `assign`, so only the perturbed columns are copied
+    and the untouched ones are shared with the chunk.
+    """
+    n = len(df)
+    return {
+        # Test 1: Missing Age and Gender columns
+        "missing_columns": df.drop(columns=['Age', 'Gender']),
+        # Test 2: Age and hours as strings
+        "wrong_types": df.assign(
+            Age=df['Age'].astype(str),
+            Technology_Usage_Hours=df['Technology_Usage_Hours'].astype(str),
+        ),
+        # Test 3: 10% missing Age, 5% missing Mental_Health_Status
+        "missing_values": df.assign(
+            Age=_with_values(df['Age'], _pick(rng, n, 0.1), np.nan),
+            Mental_Health_Status=_with_category(df['Mental_Health_Status'], _pick(rng, n, 0.05), None),
+        ),
+        # Test 4: Impossible ages, more than 24 hours, negative sleep hours
+        "out_of_range": df.assign(
+            Age=_with_values(df['Age'], _pick(rng, n, 0.02), 150),
+            Technology_Usage_Hours=_with_values(df['Technology_Usage_Hours'], _pick(rng, n, 0.03), 30),
+            Sleep_Hours=_with_values(df['Sleep_Hours'], _pick(rng, n, 0.01), -5),
+        ),
+        # Test 5: 5% duplicate rows
+        "duplicates": pd.concat([df, df.iloc[_pick(rng, n, 0.05)]], ignore_index=True, copy=False),
+        # Test 6: Invalid values in categorical columns
+        "invalid_categorical": df.assign(
+            Gender=_with_category(df['Gender'], _pick(rng, n, 0.02), 'Invalid_Gender'),
+            Mental_Health_Status=_with_category(df['Mental_Health_Status'], _pick(rng, n, 0.03), 'Invalid_Status'),
+        ),
+        # Test 7: Strings mixed into the numeric Age column
+        "mixed_types": df.assign(
+            Age=_with_values(df['Age'].astype(object), _pick(rng, n, 0.01), 'Invalid_Age'),
+        ),
+    }
+
+def _content_key(test_file_path: Path) -> str:
+    """
+    Hashes the test file together with the schema and the code it is validated with.
+    """
+    validation_sources = (inspect.getfile(DataValidationTrainingPipeline), inspect.getfile(DataValidation))
+    digest = hashlib.blake2b(digest_size=16)
+    for path in (Path(test_file_path), Path("schema.yaml"), *map(Path, validation_sources)):
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+    return digest.hexdigest()
+
+def _generation_key(original_path: Path) -> str:
+    """
+    Hashes the original data together with the settings that shape the test files.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(original_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    digest.update(f"{GENERATION_SEED}:{GENERATION_CHUNKSIZE}".encode())
+    return digest.hexdigest()
+
+def _read_manifest() -> dict:
+    try:
+        return json.loads(MANIFEST_PATH.read_text())
+    except (FileNotFoundError, ValueError):
+        return {}
+
+def _test_files_current(manifest: dict, key: str) -> bool:
+    """
+    True if the manifest entry matches `key` and every test file still has its recorded size.
+    """
+    entry = manifest.get(TEST_FORMAT)
+    if not entry or entry.get("key") != key:
+        return False
+    for case in TEST_CASES:
+        try:
+            if (TEST_DIR / f"{case}.{TEST_FORMAT}").stat().st_size != entry["sizes"].get(case):
+                return False
+        except FileNotFoundError:
+            return False
+    return True
 
 def create_test_data_with_errors():
     """
     Creates test datasets with various data quality issues to test validation.
+    
+    The original file is streamed in chunks of GENERATION_CHUNKSIZE rows; every chunk
+    is perturbed and appended to all test files, so memory stays bounded by the chunk.
     """
     # Original data path
-    original_path = Path("artifacts/data_ingestion/mental_health_and_technology_usage_2024.csv")
+    original_path = ORIGINAL_DATA_PATH
     
     if not original_path.exists():
         print("❌ Original data file not found. Please run data ingestion first.")
         return
     
-    # Load original data
-    df = pd.read_csv(original_path)
-    print(f"✅ Loaded original data: {df.shape}")
-    
     # Create test directory
-    test_dir = Path("artifacts/data_ingestion/test_validation")
+    test_dir = TEST_DIR
     test_dir.mkdir(exist_ok=True)
     
-    # Test 1: Missing columns
-    print("\n🧪 Test 1: Missing columns")
-    df_missing_cols = df.drop(columns=['Age', 'Gender'])
-    df_missing_cols.to_csv(test_dir / "missing_columns.csv", index=False)
-    print("Created: missing_columns.csv (missing Age and Gender columns)")
-    
-    # Test 2: Wrong data types
-    print("\n🧪 Test 2: Wrong data types")
-    df_wrong_types = df.copy()
-    df_wrong_types['Age'] = df_wrong_types['Age'].astype(str)  # Age as string
-    df_wrong_types['Technology_Usage_Hours'] = df_wrong_types['Technology_Usage_Hours'].astype(str)  # Hours as string
-    df_wrong_types.to_csv(test_dir / "wrong_types.csv", index=False)
-    print("Created: wrong_types.csv (Age and Technology_Usage_Hours as strings)")
-    
-    # Test 3: Missing values
-    print("\n🧪 Test 3: Missing values")
-    df_missing_values = df.copy()
-    # Add some missing values
-    df_missing_values.loc[df_missing_values.sample(frac=0.1).index, 'Age'] = np.nan
-    df_missing_values.loc[df_missing_values.sample(frac=0.05).index, 'Mental_Health_Status'] = None
-    df_missing_values.to_csv(test_dir / "missing_values.csv", index=False)
-    print("Created: missing_values.csv (10% missing Age, 5% missing Mental_Health_Status)")
-    
-    # Test 4: Out of range values
-    print("\n🧪 Test 4: Out of range values")
-    df_out_of_range = df.copy()
-    # Add unrealistic values
-    df_out_of_range.loc[df_out_of_range.sample(frac=0.02).index, 'Age'] = 150  # Impossible age
-    df_out_of_range.loc[df_out_of_range.sample(frac=0.03).index, 'Technology_Usage_Hours'] = 30  # More than 24 hours
-    df_out_of_range.loc[df_out_of_range.sample(frac=0.01).index, 'Sleep_Hours'] = -5  # Negative sleep hours
-    df_out_of_range.to_csv(test_dir / "out_of_range.csv", index=False)
-    print("Created: out_of_range.csv (unrealistic values)")
-    
-    # Test 5: Duplicate rows
-    print("\n🧪 Test 5: Duplicate rows")
-    df_duplicates = df.copy()
-    # Add some duplicate rows
-    duplicate_rows = df.sample(frac=0.05)  # 5% duplicate rows
-    df_duplicates = pd.concat([df_duplicates, duplicate_rows], ignore_index=True)
-    df_duplicates.to_csv(test_dir / "duplicates.csv", index=False)
-    print("Created: duplicates.csv (5% duplicate rows)")
-    
-    # Test 6: Invalid categorical values
-    print("\n🧪 Test 6: Invalid categorical values")
-    df_invalid_cats = df.copy()
-    # Add invalid values to categorical columns
-    df_invalid_cats.loc[df_invalid_cats.sample(frac=0.02).index, 'Gender'] = 'Invalid_Gender'
-    df_invalid_cats.loc[df_invalid_cats.sample(frac=0.03).index, 'Mental_Health_Status'] = 'Invalid_Status'
-    df_invalid_cats.to_csv(test_dir / "invalid_categorical.csv", index=False)
-    print("Created: invalid_categorical.csv (invalid categorical values)")
-    
-    # Test 7: Mixed data types in same column
-    print("\n🧪 Test 7: Mixed data types")
-    df_mixed_types = df.copy()
-    # Mix string and numeric in numeric column
-    df_mixed_types.loc[df_mixed_types.sample(frac=0.01).index, 'Age'] = 'Invalid_Age'
-    df_mixed_types.to_csv(test_dir / "mixed_types.csv", index=False)
-    print("Created: mixed_types.csv (mixed data types in Age column)")
+    # Same original data and settings as last time: the test files are already there
+    key = _generation_key(original_path)
+    manifest = _read_manifest()
+    if _test_files_current(manifest, key):
+        print(f"\n✅ Test files are up to date in: {test_dir}")
+        return test_dir
+    
+    # One seeded random generator shared by all perturbations, so the files are reproducible
+    rng = np.random.default_rng(GENERATION_SEED)
+    
+    print(f"\n🧪 Generating test files in chunks of {GENERATION_CHUNKSIZE} rows")
+    n_rows = 0
+    writers, schemas = {}, {}
+    with ExitStack() as stack:
+        # Arrow's CSV and IPC writers release the GIL, so the test files are written concurrently
+        executor = stack.enter_context(ThreadPoolExecutor(max_workers=4))
+        for chunk in pd.read_csv(original_path, chunksize=GENERATION_CHUNKSIZE, dtype=NARROW_DTYPES):
+            tables = {}
+            for name, variant in _make_variants(chunk, rng).items():
+                table = _to_arrow(variant)
+                if name not in writers:
+                    # The first chunk fixes each file's schema; later chunks are cast to it
+                    schemas[name] = table.schema
+                    path = test_dir / f"{name}.{TEST_FORMAT}"
+                    writers[name] = stack.enter_context(_open_writer(path, table.schema))
+                tables[name] = table.cast(schemas[name])
+            # Each file has one write per chunk; wait for all of them before the next chunk
+            list(executor.map(lambda name: writers[name].write_table(tables[name]), tables))
+            n_rows += len(chunk)
+    print(f"✅ Processed original data: {n_rows} rows")
+    
+    manifest[TEST_FORMAT] = {
+        "key": key,
+        "sizes": {case: (test_dir / f"{case}.{TEST_FORMAT}").stat().st_size for case in TEST_CASES},
+    }
+    MANIFEST_PATH.write_text(json.dumps(manifest, indent=2))
     
     print(f"\n✅ All test files created in: {test_dir}")
     print("\n📋 Test files summary:")
@@ -93,122 +304,199 @@ def create_test_data_with_errors():
     
     return test_dir
 
-def test_validation_with_file(test_file_path):
+_PIPELINE = None
+
+def _get_pipeline() -> DataValidationTrainingPipeline:
     """
-    Tests the validation pipeline with a specific test file.
+    Builds the validation pipeline (and parses its config) once per process.
     """
-    print(f"\n🔍 Testing validation with: {test_file_path}")
+    global _PIPELINE
+    if _PIPELINE is None:
+        _PIPELINE = DataValidationTrainingPipeline()
+    return _PIPELINE
+
+def _flush_logs():
+    for handler in logging.getLogger().handlers:
+        handler.flush()
+
+def _init_worker():
+    """
+    Drops the log records a forked worker inherits from the parent's buffer.
+    
+    The parent still writes them itself; the worker would write them a second time.
+    """
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, logging.handlers.MemoryHandler):
+            with handler.lock:
+                handler.buffer.clear()
+
+def _validate_file(test_file_path, use_cache: bool = True):
+    """
+    Runs the validation pipeline on one test file and returns (status, cached).
     
-    # Temporarily replace the original file
-    original_path = Path("artifacts/data_ingestion/mental_health_and_technology_usage_2024.csv")
-    backup_path = Path("artifacts/data_ingestion/mental_health_and_technology_usage_2024_backup.csv")
+    Each test file gets its own status directory, so several files can be validated at once.
+    With use_cache=False neither this script's nor the pipeline's cached results are used.
+    """
+    # Unchanged test file, schema and validation code: reuse the status from the last run
+    cache_path = VALIDATION_CACHE_DIR / f"{_content_key(test_file_path)}.json"
+    if use_cache:
+        try:
+            return json.loads(cache_path.read_text())["status"], True
+        except (FileNotFoundError, ValueError, KeyError):
+            pass
     
-    # Backup original file
-    if original_path.exists():
-        shutil.copy2(original_path, backup_path)
+    validation_pipeline = _get_pipeline()
+    status_file = Path("artifacts/data_validation") / Path(test_file_path).stem / "status.txt"
+    status_file.unlink(missing_ok=True)
+    if not use_cache:
+        status_file.with_name("validation_cache.json").unlink(missing_ok=True)
+    validation_pipeline.data_validation_config.STATUS_FILE = status_file
     
-    # Replace with test file
-    shutil.copy2(test_file_path, original_path)
+    # Run validation directly on the test file. Pool workers exit without running
+    # atexit, so the buffered log records are written out here
+    try:
+        validation_pipeline.initiate_data_validation(data_path=test_file_path)
+    finally:
+        _flush_logs()
     
     try:
-        # Run validation
-        from src.datascience.pipeline.data_validation_pipeline import DataValidationTrainingPipeline
-        
-        validation_pipeline = DataValidationTrainingPipeline()
-        validation_pipeline.initiate_data_validation()
-        
-        # Check validation status
-        status_file = Path("artifacts/data_validation/status.txt")
-        if status_file.exists():
-            with open(status_file, 'r') as f:
-                status = f.read()
-            print(f"Validation Status:\n{status}")
-        else:
-            print("❌ No validation status file found")
-            
+        status = status_file.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None, False
+    VALIDATION_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with open(cache_path, 'w') as f:
+        json.dump({"file": str(test_file_path), "status": status}, f)
+    return status, False
+
+def _print_status(status, cached):
+    if status is None:
+        print("❌ No validation status file found")
+    elif cached:
+        print(f"Validation Status (cached):\n{status}")
+    else:
+        print(f"Validation Status:\n{status}")
+
+def validate_with_file(test_file_path):
+    """
+    Runs the validation pipeline on a specific test file and prints its status.
+    """
+    print(f"\n🔍 Testing validation with: {test_file_path}")
+    
+    try:
+        _print_status(*_validate_file(test_file_path))
     except Exception as e:
         print(f"❌ Validation failed with error: {e}")
-    
-    finally:
-        # Restore original file
-        if backup_path.exists():
-            shutil.copy2(backup_path, original_path)
-            backup_path.unlink()
 
 def run_all_validation_tests():
     """
-    Runs validation tests on all created test files.
+    Runs validation tests on all created test files, one worker process per file.
     """
     test_dir = create_test_data_with_errors()
     
     if not test_dir:
         return
     
-    test_files = [
-        "missing_columns.csv",
-        "wrong_types.csv", 
-        "missing_values.csv",
-        "out_of_range.csv",
-        "duplicates.csv",
-        "invalid_categorical.csv",
-        "mixed_types.csv"
-    ]
-    
     print("\n" + "="*60)
     print("🧪 RUNNING ALL VALIDATION TESTS")
     print("="*60)
     
-    for test_file in test_files:
-        test_file_path = test_dir / test_file
+    test_paths = []
+    for case in TEST_CASES:
+        test_file_path = test_dir / f"{case}.{TEST_FORMAT}"
         if test_file_path.exists():
-            test_validation_with_file(test_file_path)
-            print("-" * 40)
+            test_paths.append(test_file_path)
         else:
-            print(f"❌ Test file not found: {test_file}")
+            print(f"❌ Test file not found: {test_file_path.name}")
+    
+    if not test_paths:
+        return
+    
+    # The files are independent; validate them in parallel and report in order
+    with ProcessPoolExecutor(
+        max_workers=min(len(test_paths), os.cpu_count() or 1), initializer=_init_worker
+    ) as executor:
+        futures = [executor.submit(_validate_file, path) for path in test_paths]
+        for test_file_path, future in zip(test_paths, futures):
+            print(f"\n🔍 Testing validation with: {test_file_path}")
+            try:
+                _print_status(*future.result())
+            except Exception as e:
+                print(f"❌ Validation failed with error: {e}")
+            print("-" * 40)
 
-if __name__ == "__main__":
+@pytest.fixture(scope="module")
+def generated_test_dir():
+    test_dir = create_test_data_with_errors()
+    if not test_dir:
+        pytest.skip("Original data file not found; run data ingestion first")
+    return test_dir
+
+@pytest.mark.parametrize(
+    "case", [pytest.param(case, marks=KNOWN_GAPS.get(case, ())) for case in TEST_CASES]
+)
+def test_validation_case(generated_test_dir, case):
+    """
+    Every generated test file must fail validation in the category its perturbation targets.
+    """
+    status, _ = _validate_file(generated_test_dir / f"{case}.{TEST_FORMAT}", use_cache=False)
+    assert status is not None, "No validation status file found"
+    assert status.startswith("VALIDATION FAILED")
+    assert f"❌ {EXPECTED_FAILURES[case]}:" in status
+
+@pytest.fixture(scope="module")
+def in_memory_variants():
+    if not ORIGINAL_DATA_PATH.exists():
+        pytest.skip("Original data file not found; run data ingestion first")
+    sample = pd.read_csv(ORIGINAL_DATA_PATH, nrows=IN_MEMORY_SAMPLE_ROWS, dtype=NARROW_DTYPES)
+    return _make_variants(sample, np.random.default_rng(GENERATION_SEED))
+
+@pytest.mark.parametrize(
+    "case", [
+        pytest.param(case, marks=IN_MEMORY_GAPS.get(case, ())) for case in TEST_CASES
+    ]
+)
+def test_in_memory_validation_case(in_memory_variants, case):
+    """
+    Perturbed frames validated in memory, without writing a file, fail like the generated files.
+    """
+    # Same column types as the Feather test files, without the round trip through disk
+    data = _to_arrow(in_memory_variants[case]).to_pandas()
+    validation_pipeline = _get_pipeline()
+    status_file = Path("artifacts/data_validation/in_memory") / case / "status.txt"
+    status_file.unlink(missing_ok=True)
+    validation_pipeline.data_validation_config.STATUS_FILE = status_file
+    
+    validation_pipeline.initiate_data_validation(df=data)
+    
+    status = status_file.read_text(encoding="utf-8")
+    assert status.startswith("VALIDATION FAILED")
+    assert f"❌ {EXPECTED_FAILURES[case]}:" in status
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Data Validation Testing Script")
+    parser.add_argument(
+        "--case",
+        choices=TEST_CASES + ["all"],
+        default="all",
+        help="test file to validate, or 'all' to run every case (default: all)",
+    )
+    args = parser.parse_args(argv)
+    
     print("🧪 Data Validation Testing Script")
     print("="*40)
     
-    # Create test data with errors
-    create_test_data_with_errors()
-    
-    # Ask user which test to run
-    print("\n" + "="*40)
-    print("Choose a test to run:")
-    print("1. missing_columns.csv")
-    print("2. wrong_types.csv")
-    print("3. missing_values.csv")
-    print("4. out_of_range.csv")
-    print("5. duplicates.csv")
-    print("6. invalid_categorical.csv")
-    print("7. mixed_types.csv")
-    print("8. Run all tests")
-    print("0. Exit")
-    
-    choice = input("\nEnter your choice (0-8): ")
-    
-    test_dir = Path("artifacts/data_ingestion/test_validation")
-    
-    if choice == "0":
-        print("👋 Exiting...")
-    elif choice == "8":
+    if args.case == "all":
         run_all_validation_tests()
-    elif choice in ["1", "2", "3", "4", "5", "6", "7"]:
-        test_files = [
-            "missing_columns.csv",
-            "wrong_types.csv", 
-            "missing_values.csv",
-            "out_of_range.csv",
-            "duplicates.csv",
-            "invalid_categorical.csv",
-            "mixed_types.csv"
-        ]
-        test_file = test_files[int(choice) - 1]
-        test_file_path = test_dir / test_file
-        if test_file_path.exists():
-            test_validation_with_file(test_file_path)
-        else:
-            print(f"❌ Test file not found: {test_file}")
+        return
+    
+    # Create test data with errors
+    if not create_test_data_with_errors():
+        return
+    test_file_path = TEST_DIR / f"{args.case}.{TEST_FORMAT}"
+    if test_file_path.exists():
+        validate_with_file(test_file_path)
     else:
-        print("❌ Invalid choice") 
\ No newline at end of file
+        print(f"❌ Test file not found: {test_file_path.name}")
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ Simple test script to verify data validation implementation
 """
 
 import sys
+import logging
 from pathlib import Path
 
 # Add the src directory to the path
@@ -13,6 +14,8 @@ from datascience.config.configuration import ConfigurationManager
 from datascience.components.data_validation import DataValidation
 from datascience.utils.common import load_json_data
 
+logger = logging.getLogger(__name__)
+
 def test_data_validation():
     """Test the data validation implementation"""
     try:
@@ -62,8 +65,9 @@ def test_data_validation():
         
     except Exception as e:
         print(f"❌ Test failed with error: {e}")
-        import traceback
-        traceback.print_exc()
+        # The full traceback is only formatted when debugging
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.exception("Test failed with error: %s", e)
         return False
 
 if __name__ == "__main__":